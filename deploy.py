@@ -29,13 +29,23 @@ Requirements:
 """
 
 import argparse
+import functools
+import hashlib
+import http.client
+import secrets
+import shutil
+import ssl
 import subprocess
 import sys
 import os
+import queue
+import threading
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Set, Tuple
 
 
 class Colors:
@@ -62,6 +72,9 @@ class Config:
     API_VERSION = os.getenv("API_VERSION", "1.0.0")
     CERT_DAYS = 825  # ~2.25 years
     CA_DAYS = 3650  # 10 years
+    CERT_RENEW_DAYS = 30  # regenerate when the server cert expires sooner
+    HEALTH_TIMEOUT = 60  # seconds per container
+    STOP_TIMEOUT = 2  # seconds before docker stop sends SIGKILL
 
 
 class Logger:
@@ -101,7 +114,9 @@ class CommandRunner:
 
     @staticmethod
     def run(cmd: List[str], capture_output: bool = False, check: bool = True,
-            cwd: Optional[str] = None) -> Tuple[int, str, str]:
+            cwd: Optional[str] = None,
+            env: Optional[Dict[str, str]] = None,
+            discard: bool = False) -> Tuple[int, str, str]:
         """
         Run a shell command
 
@@ -110,27 +125,43 @@ class CommandRunner:
             capture_output: Whether to capture stdout/stderr
             check: Whether to raise exception on non-zero exit
             cwd: Working directory
+            env: Environment for the child process (defaults to inherited)
+            discard: Send stdout/stderr to /dev/null (overrides capture_output)
 
         Returns:
             Tuple of (returncode, stdout, stderr)
         """
         try:
-            if capture_output:
+            if discard:
+                result = subprocess.run(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    cwd=cwd,
+                    env=env,
+                    check=check
+                )
+                return result.returncode, "", ""
+            elif capture_output:
                 result = subprocess.run(
                     cmd,
                     capture_output=True,
                     text=True,
                     cwd=cwd,
+                    env=env,
                     check=check
                 )
                 return result.returncode, result.stdout, result.stderr
             else:
-                result = subprocess.run(cmd, cwd=cwd, check=check)
+                result = subprocess.run(cmd, cwd=cwd, env=env, check=check)
                 return result.returncode, "", ""
         except subprocess.CalledProcessError as e:
             if capture_output:
                 return e.returncode, e.stdout or "", e.stderr or ""
             return e.returncode, "", ""
+        except FileNotFoundError as e:
+            # Same code a shell uses for "command not found"; callers report it
+            return 127, "", str(e)
         except Exception as e:
             Logger.error(f"Command failed: {e}")
             return 1, "", str(e)
@@ -140,11 +171,128 @@ class CommandRunner:
         """Run command silently and return success status"""
         returncode, _, _ = CommandRunner.run(
             cmd,
-            capture_output=True,
-            check=False
+            check=False,
+            discard=True
         )
         return returncode == 0
 
+    @staticmethod
+    def stream(cmd: List[str], prefix: str = "", cwd: Optional[str] = None,
+               env: Optional[Dict[str, str]] = None) -> int:
+        """
+        Run a command, echoing its combined stdout/stderr line by line
+
+        Args:
+            cmd: Command and arguments as list
+            prefix: Text prepended to every output line
+            cwd: Working directory
+            env: Environment for the child process (defaults to inherited)
+
+        Returns:
+            Process return code
+        """
+        try:
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                encoding="utf-8",
+                errors="replace",  # Build steps may print arbitrary bytes
+                bufsize=1,
+                cwd=cwd,
+                env=env
+            ) as proc:
+                for line in proc.stdout:
+                    print(f"{prefix}{line}", end="", flush=True)
+            return proc.returncode
+        except OSError as e:
+            Logger.error(f"Command failed: {e}")
+            return 1
+
+    @staticmethod
+    def spawn(cmd: List[str]) -> subprocess.Popen:
+        """Start a command in the background with stdout/stderr captured"""
+        return subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _openssl_version() -> Tuple[bool, str]:
+    """
+    Probe the OpenSSL binary once per process
+
+    The result is also persisted under the user cache directory, keyed on
+    the binary's path and mtime, so repeat runs skip the subprocess entirely.
+
+    Returns:
+        Tuple of (available, version string)
+    """
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        return False, ""
+
+    key = {"path": openssl, "mtime": os.stat(openssl).st_mtime}
+
+    try:
+        # An empty XDG_CACHE_HOME counts as unset; Path.home() raises
+        # RuntimeError (KeyError before Python 3.8) without a home directory
+        cache_dir = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_file = Path(cache_dir) / "deploy-py" / "openssl.json"
+    except (RuntimeError, KeyError):
+        cache_file = None
+
+    try:
+        if cache_file is not None:
+            cached = json.loads(cache_file.read_text())
+            if cached.get("key") == key:
+                return True, cached["version"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    returncode, stdout, _ = CommandRunner.run(
+        ["openssl", "version"],
+        capture_output=True,
+        check=False
+    )
+    if returncode != 0:
+        return False, ""
+
+    version = stdout.strip()
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps({"key": key, "version": version}))
+        except OSError:
+            pass
+
+    return True, version
+
+
+@functools.lru_cache(maxsize=1)
+def _docker_ok() -> bool:
+    """Check once per process that the Docker CLI is on PATH (no subprocess)"""
+    return shutil.which("docker") is not None
+
+
+class _ResumableHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection that can resume an earlier TLS session"""
+
+    def __init__(self, host: str, port: int, context: ssl.SSLContext,
+                 session: Optional[ssl.SSLSession] = None, **kwargs):
+        super().__init__(host, port, context=context, **kwargs)
+        self.ssl_context = context
+        self.tls_session = session
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+        self.sock = self.ssl_context.wrap_socket(
+            self.sock, server_hostname=self.host, session=self.tls_session
+        )
+
 
 class CertificateGenerator:
     """Handle SSL/TLS certificate generation"""
@@ -157,12 +305,15 @@ class CertificateGenerator:
         self.city = "City"
         self.org = "DevOps Mid Task"
         self.ou = "IT"
+        self._ca_subject = f"/C={self.country}/ST={self.state}/L={self.city}/O={self.org} CA/OU={self.ou}/CN={self.org} Root CA"
+        self._server_subject = f"/C={self.country}/ST={self.state}/L={self.city}/O={self.org}/OU={self.ou}/CN={self.domain}"
 
     def check_prerequisites(self) -> bool:
         """Check if OpenSSL is available"""
         Logger.header("Checking Prerequisites")
 
-        if not CommandRunner.run_silent(["openssl", "version"]):
+        available, version = _openssl_version()
+        if not available:
             Logger.error("OpenSSL is not installed")
             Logger.info("Install OpenSSL:")
             Logger.info("  Ubuntu/Debian: sudo apt-get install openssl")
@@ -170,23 +321,160 @@ class CertificateGenerator:
             Logger.info("  macOS:         brew install openssl")
             return False
 
-        returncode, stdout, _ = CommandRunner.run(
-            ["openssl", "version"],
-            capture_output=True
-        )
-        Logger.success(f"OpenSSL is installed ({stdout.strip()})")
+        Logger.success(f"OpenSSL is installed ({version})")
+        return True
+
+    @staticmethod
+    def _write_file(path: Path, content: str, mode: int = 0o644):
+        """Write a file and set its permissions through the open descriptor"""
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            # The open() mode is masked by the umask and ignored for existing
+            # files, so apply it explicitly (fchmod is unavailable on Windows)
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, mode)
+            os.write(fd, content.encode())
+        finally:
+            os.close(fd)
+
+    def is_cached_valid(self) -> bool:
+        """
+        Check whether the existing certificates can be reused
+
+        The server certificate must cover the domain and stay valid for at
+        least Config.CERT_RENEW_DAYS. Its expiry is cached in server.json,
+        keyed on the certificate's SHA-256, so unchanged certificates are
+        validated without running openssl. If the certificate cannot be
+        inspected, it is kept (with a warning) rather than replacing the CA
+        users may already trust.
+        """
+        server_crt = self.certs_dir / "server.crt"
+        cache_file = self.certs_dir / "server.json"
+
+        # One directory read (dirent types are cached) instead of a stat per file
+        try:
+            with os.scandir(self.certs_dir) as entries:
+                files = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return False
+        # ca.key is only needed to regenerate, and may have been moved offline
+        if not {"ca.crt", "server.key", "server.crt"} <= files:
+            return False
+
+        def keep_unverified(reason: str) -> bool:
+            Logger.warning(f"Could not check {server_crt} ({reason}), keeping existing certificates")
+            Logger.info("Use --force to regenerate them")
+            return True
+
+        try:
+            digest = hashlib.sha256(server_crt.read_bytes()).hexdigest()
+        except OSError as e:
+            return keep_unverified(str(e))
+
+        not_after = None
+
+        try:
+            cached = json.loads(cache_file.read_text())
+            if cached.get("sha256") == digest and cached.get("domain") == self.domain:
+                not_after = float(cached["notAfter"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+        if not_after is None:
+            # -text and -enddate are available in every OpenSSL/LibreSSL
+            # version, unlike -ext (OpenSSL 1.1.1+)
+            returncode, stdout, stderr = CommandRunner.run(
+                ["openssl", "x509", "-in", str(server_crt), "-noout", "-enddate", "-text"],
+                capture_output=True,
+                check=False
+            )
+            if returncode != 0:
+                return keep_unverified(stderr.strip() or f"openssl exited with {returncode}")
+
+            lines = [line.strip() for line in stdout.splitlines()]
+            names = set()
+            try:
+                for index, line in enumerate(lines):
+                    if line.startswith("notAfter="):
+                        not_after = datetime.strptime(
+                            line[len("notAfter="):], "%b %d %H:%M:%S %Y %Z"
+                        ).replace(tzinfo=timezone.utc).timestamp()
+                    elif line.startswith("X509v3 Subject Alternative Name") and index + 1 < len(lines):
+                        names.update(name.strip() for name in lines[index + 1].split(","))
+            except ValueError as e:
+                return keep_unverified(f"unexpected expiry format: {e}")
+
+            if not_after is None:
+                return keep_unverified("no expiry date in openssl output")
+
+            if f"DNS:{self.domain}" not in names:
+                Logger.info(f"Existing server certificate does not cover {self.domain}")
+                return False
+
+            try:
+                cache_file.write_text(json.dumps({
+                    "sha256": digest,
+                    "domain": self.domain,
+                    "notAfter": not_after
+                }))
+            except OSError:
+                pass
+
+        if not_after <= time.time() + Config.CERT_RENEW_DAYS * 86400:
+            Logger.info(f"Existing server certificate expires within {Config.CERT_RENEW_DAYS} days")
+            return False
+
         return True
 
     def create_certs_directory(self) -> bool:
         """Create certificates directory"""
         Logger.header("Creating Certificates Directory")
 
-        if self.certs_dir.exists():
+        # Attempt the mkdir directly instead of stat-ing first
+        try:
+            self.certs_dir.mkdir(parents=True)
+            Logger.success(f"Directory created: {self.certs_dir}")
+        except FileExistsError:
             Logger.warning(f"Directory '{self.certs_dir}' already exists")
             Logger.info("Using existing directory")
-        else:
-            self.certs_dir.mkdir(parents=True, exist_ok=True)
-            Logger.success(f"Directory created: {self.certs_dir}")
+
+        return True
+
+    def generate_private_keys(self) -> bool:
+        """Generate CA and server private keys concurrently"""
+        Logger.header("Generating Private Keys")
+
+        ca_key = self.certs_dir / "ca.key"
+        server_key = self.certs_dir / "server.key"
+
+        # Both keys are independent, so run openssl in parallel
+        Logger.info("Generating CA and server private keys (ECDSA P-256)...")
+        # Named-curve encoding is explicit because OpenSSL 1.0.x otherwise
+        # writes explicit EC parameters, which Go's crypto/x509 rejects
+        ec_keygen = [
+            "openssl", "genpkey", "-algorithm", "EC",
+            "-pkeyopt", "ec_paramgen_curve:P-256",
+            "-pkeyopt", "ec_param_enc:named_curve"
+        ]
+        try:
+            ca_proc = CommandRunner.spawn([*ec_keygen, "-out", str(ca_key)])
+            server_proc = CommandRunner.spawn([*ec_keygen, "-out", str(server_key)])
+        except OSError as e:
+            Logger.error(f"Failed to start key generation: {e}")
+            return False
+
+        _, ca_stderr = ca_proc.communicate()
+        _, server_stderr = server_proc.communicate()
+
+        if ca_proc.returncode != 0:
+            Logger.error(f"Failed to generate CA key: {ca_stderr}")
+            return False
+        Logger.success(f"CA private key generated: {ca_key}")
+
+        if server_proc.returncode != 0:
+            Logger.error(f"Failed to generate server key: {server_stderr}")
+            return False
+        Logger.success(f"Server private key generated: {server_key}")
 
         return True
 
@@ -196,28 +484,16 @@ class CertificateGenerator:
 
         ca_key = self.certs_dir / "ca.key"
         ca_crt = self.certs_dir / "ca.crt"
-
-        # Generate CA private key
-        Logger.info("Generating CA private key (4096-bit RSA)...")
-        returncode, _, stderr = CommandRunner.run(
-            ["openssl", "genrsa", "-out", str(ca_key), "4096"],
-            capture_output=True,
-            check=False
-        )
-        if returncode != 0:
-            Logger.error(f"Failed to generate CA key: {stderr}")
-            return False
-        Logger.success(f"CA private key generated: {ca_key}")
+        ca_srl = self.certs_dir / "ca.srl"
 
         # Generate self-signed CA certificate
         Logger.info("Generating self-signed CA certificate...")
-        subject = f"/C={self.country}/ST={self.state}/L={self.city}/O={self.org} CA/OU={self.ou}/CN={self.org} Root CA"
         returncode, _, stderr = CommandRunner.run(
             [
                 "openssl", "req", "-new", "-x509", "-days", str(Config.CA_DAYS),
                 "-key", str(ca_key),
                 "-out", str(ca_crt),
-                "-subj", subject
+                "-subj", self._ca_subject
             ],
             capture_output=True,
             check=False
@@ -227,6 +503,11 @@ class CertificateGenerator:
             return False
         Logger.success(f"CA certificate generated: {ca_crt} (valid for 10 years)")
 
+        # Seed the serial file for the new CA so signing doesn't need
+        # -CAcreateserial. The serial is random because browsers reject a
+        # reused issuer/serial pair across regenerated CAs with the same name.
+        self._write_file(ca_srl, f"{secrets.randbits(63) | 1 << 62:X}\n")
+
         return True
 
     def generate_server_certificate(self) -> bool:
@@ -239,28 +520,16 @@ class CertificateGenerator:
         server_ext = self.certs_dir / "server.ext"
         ca_key = self.certs_dir / "ca.key"
         ca_crt = self.certs_dir / "ca.crt"
-
-        # Generate server private key
-        Logger.info("Generating server private key (2048-bit RSA)...")
-        returncode, _, stderr = CommandRunner.run(
-            ["openssl", "genrsa", "-out", str(server_key), "2048"],
-            capture_output=True,
-            check=False
-        )
-        if returncode != 0:
-            Logger.error(f"Failed to generate server key: {stderr}")
-            return False
-        Logger.success(f"Server private key generated: {server_key}")
+        ca_srl = self.certs_dir / "ca.srl"
 
         # Generate CSR
         Logger.info("Generating certificate signing request (CSR)...")
-        subject = f"/C={self.country}/ST={self.state}/L={self.city}/O={self.org}/OU={self.ou}/CN={self.domain}"
         returncode, _, stderr = CommandRunner.run(
             [
                 "openssl", "req", "-new",
                 "-key", str(server_key),
                 "-out", str(server_csr),
-                "-subj", subject
+                "-subj", self._server_subject
             ],
             capture_output=True,
             check=False
@@ -274,7 +543,7 @@ class CertificateGenerator:
         Logger.info("Creating certificate extensions file...")
         extensions_content = f"""authorityKeyIdentifier=keyid,issuer
 basicConstraints=CA:FALSE
-keyUsage = digitalSignature, nonRepudiation, keyEncipherment, dataEncipherment
+keyUsage = digitalSignature, keyAgreement
 subjectAltName = @alt_names
 
 [alt_names]
@@ -283,7 +552,7 @@ DNS.2 = *.{self.domain}
 DNS.3 = localhost
 IP.1 = 127.0.0.1
 """
-        server_ext.write_text(extensions_content)
+        self._write_file(server_ext, extensions_content)
         Logger.success(f"Extensions file created: {server_ext}")
 
         # Sign server certificate
@@ -294,7 +563,7 @@ IP.1 = 127.0.0.1
                 "-in", str(server_csr),
                 "-CA", str(ca_crt),
                 "-CAkey", str(ca_key),
-                "-CAcreateserial",
+                "-CAserial", str(ca_srl),
                 "-out", str(server_crt),
                 "-days", str(Config.CERT_DAYS),
                 "-sha256",
@@ -335,15 +604,15 @@ IP.1 = 127.0.0.1
         """Set proper file permissions"""
         Logger.header("Setting Permissions")
 
-        # Set private key permissions to 600
-        for key_file in self.certs_dir.glob("*.key"):
-            key_file.chmod(0o600)
+        # Private keys get 600, everything else 644, in a single pass.
+        # Files written via _write_file already have their final mode.
+        skip = {"server.ext", "README.md"}
+        with os.scandir(self.certs_dir) as entries:
+            for entry in entries:
+                if entry.name in skip or not entry.is_file(follow_symlinks=False):
+                    continue
+                os.chmod(entry.path, 0o600 if entry.name.endswith(".key") else 0o644)
         Logger.success("Private keys secured (600 permissions)")
-
-        # Set other files to 644
-        for file in self.certs_dir.glob("*"):
-            if file.suffix != ".key" and file.is_file():
-                file.chmod(0o644)
         Logger.success("Certificates set to readable (644 permissions)")
 
         return True
@@ -370,13 +639,15 @@ For production, use certificates from a trusted Certificate Authority (e.g., Let
 - `server.csr` - Certificate Signing Request
 - `server.ext` - Certificate extensions configuration
 - `ca.srl` - Serial number file
+- `server.json` - Cached server certificate expiry
 
 ## Regenerating Certificates
 
-To regenerate certificates, run:
+Existing certificates are reused while they remain valid. To regenerate
+them anyway, run:
 
 ```bash
-python3 deploy.py certs
+python3 deploy.py certs --force
 ```
 
 ## Security Notes
@@ -386,18 +657,25 @@ python3 deploy.py certs
 - Certificates should be regenerated periodically
 - Use proper certificates from a trusted CA for production
 """
-        readme_path.write_text(readme_content)
+        self._write_file(readme_path, readme_content)
         Logger.success(f"README created: {readme_path}")
         return True
 
-    def generate_all(self) -> bool:
-        """Generate all certificates"""
+    def generate_all(self, force: bool = False) -> bool:
+        """Generate all certificates, reusing valid ones unless forced"""
+        if not force and self.is_cached_valid():
+            Logger.success(f"Reusing existing certificates for {self.domain}")
+            return True
+
         if not self.check_prerequisites():
             return False
 
         if not self.create_certs_directory():
             return False
 
+        if not self.generate_private_keys():
+            return False
+
         if not self.generate_ca_certificate():
             return False
 
@@ -419,8 +697,8 @@ python3 deploy.py certs
         Logger.info(f"Domain:         {self.domain}")
         Logger.info(f"Valid for:      {Config.CERT_DAYS} days (~2.25 years)")
         Logger.info(f"CA valid for:   {Config.CA_DAYS} days (10 years)")
-        Logger.info(f"Algorithm:      RSA SHA-256")
-        Logger.info(f"Key sizes:      CA: 4096-bit, Server: 2048-bit")
+        Logger.info(f"Algorithm:      ECDSA P-256 / SHA-256")
+        Logger.info(f"Key type:       P-256 (CA and server)")
         print()
 
         return True
@@ -434,7 +712,7 @@ class DockerDeployer:
 
     def check_docker(self) -> bool:
         """Check if Docker is available"""
-        if not CommandRunner.run_silent(["docker", "--version"]):
+        if not _docker_ok():
             Logger.error("Docker is not installed or not running")
             return False
         return True
@@ -448,42 +726,61 @@ class DockerDeployer:
             Logger.error("Dockerfile not found. Are you in the project root?")
             return False
 
-        # Build webapp image
-        Logger.info("Building webapp image...")
-        returncode, _, stderr = CommandRunner.run(
-            ["docker", "build", "-t", Config.WEBAPP_IMAGE, "."],
-            check=False
-        )
-        if returncode != 0:
-            Logger.error(f"Failed to build webapp image: {stderr}")
-            return False
-        Logger.success("Webapp image built")
+        # Both images have independent Dockerfiles, so build them in parallel.
+        # Plain progress output is streamed with a per-image prefix so the
+        # two logs stay readable when interleaved.
+        env = {**os.environ, "DOCKER_BUILDKIT": "1"}
+
+        # Embed cache metadata in each image and reuse the previous tag as a
+        # cache source, so unchanged layers are skipped on cold daemons (CI)
+        def build_args(image: str) -> List[str]:
+            return [
+                "--progress=plain",
+                "--build-arg", "BUILDKIT_INLINE_CACHE=1",
+                "--cache-from", image
+            ]
+
+        Logger.info("Building webapp and nginx images...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            webapp_build = executor.submit(
+                CommandRunner.stream,
+                ["docker", "build", "-t", Config.WEBAPP_IMAGE,
+                 *build_args(Config.WEBAPP_IMAGE), "."],
+                prefix="[webapp] ",
+                env=env
+            )
+            nginx_build = executor.submit(
+                CommandRunner.stream,
+                ["docker", "build", "-f", "nginx/Dockerfile", "-t", Config.NGINX_IMAGE,
+                 *build_args(Config.NGINX_IMAGE), "."],
+                prefix="[nginx] ",
+                env=env
+            )
+            webapp_returncode = webapp_build.result()
+            nginx_returncode = nginx_build.result()
 
-        # Build nginx image
-        Logger.info("Building nginx image...")
-        returncode, _, stderr = CommandRunner.run(
-            ["docker", "build", "-f", "nginx/Dockerfile", "-t", Config.NGINX_IMAGE, "."],
-            check=False
-        )
-        if returncode != 0:
-            Logger.error(f"Failed to build nginx image: {stderr}")
-            return False
-        Logger.success("Nginx image built")
+        success = True
 
-        return True
+        if webapp_returncode != 0:
+            Logger.error("Failed to build webapp image (see output above)")
+            success = False
+        else:
+            Logger.success("Webapp image built")
+
+        if nginx_returncode != 0:
+            Logger.error("Failed to build nginx image (see output above)")
+            success = False
+        else:
+            Logger.success("Nginx image built")
+
+        return success
 
     def create_network(self) -> bool:
         """Create Docker network"""
         Logger.header("Creating Docker Network")
 
         # Check if network exists
-        returncode, stdout, _ = CommandRunner.run(
-            ["docker", "network", "inspect", Config.NETWORK_NAME],
-            capture_output=True,
-            check=False
-        )
-
-        if returncode == 0:
+        if CommandRunner.run_silent(["docker", "network", "inspect", Config.NETWORK_NAME]):
             Logger.info(f"Network {Config.NETWORK_NAME} already exists")
             return True
 
@@ -500,33 +797,50 @@ class DockerDeployer:
         Logger.success(f"Network {Config.NETWORK_NAME} created")
         return True
 
+    def existing_containers(self) -> Set[str]:
+        """Return which deployment containers exist, running or not"""
+        # Name filters are OR'ed, so a single docker ps covers both containers.
+        # Anchored names rather than the service label, so an unlabeled
+        # container holding the name is still found before docker run.
+        _, stdout, _ = CommandRunner.run(
+            [
+                "docker", "ps", "-a",
+                "--filter", f"name=^{Config.WEBAPP_CONTAINER}$",
+                "--filter", f"name=^{Config.NGINX_CONTAINER}$",
+                "--format", "{{.Names}}"
+            ],
+            capture_output=True,
+            check=False
+        )
+        return set(stdout.split())
+
+    @staticmethod
+    def remove_containers(containers: List[str]):
+        """Stop and remove containers, one docker invocation per verb"""
+        CommandRunner.run_silent(["docker", "stop", "-t", str(Config.STOP_TIMEOUT), *containers])
+        CommandRunner.run_silent(["docker", "rm", *containers])
+
     def stop_existing_containers(self) -> bool:
         """Stop and remove existing containers"""
         Logger.header("Stopping Existing Containers")
 
-        for container in [Config.WEBAPP_CONTAINER, Config.NGINX_CONTAINER]:
-            # Check if container exists
-            returncode, stdout, _ = CommandRunner.run(
-                ["docker", "ps", "-a", "--filter", f"name={container}", "--format", "{{.Names}}"],
-                capture_output=True,
-                check=False
-            )
-
-            if container in stdout:
-                Logger.info(f"Stopping and removing {container}...")
-                CommandRunner.run_silent(["docker", "stop", container])
-                CommandRunner.run_silent(["docker", "rm", container])
+        existing = self.existing_containers()
+        containers = [c for c in [Config.WEBAPP_CONTAINER, Config.NGINX_CONTAINER] if c in existing]
+        if containers:
+            Logger.info(f"Stopping and removing {', '.join(containers)}...")
+            self.remove_containers(containers)
+            for container in containers:
                 Logger.success(f"{container} removed")
 
         return True
 
-    def start_webapp(self) -> bool:
-        """Start webapp container"""
-        Logger.header("Starting Web Application")
+    def create_webapp(self) -> bool:
+        """Create webapp container"""
+        Logger.info("Creating web application container...")
 
         returncode, _, stderr = CommandRunner.run(
             [
-                "docker", "run", "-d",
+                "docker", "create",
                 "--name", Config.WEBAPP_CONTAINER,
                 "--network", Config.NETWORK_NAME,
                 "-e", f"API_VERSION={Config.API_VERSION}",
@@ -545,19 +859,19 @@ class DockerDeployer:
         )
 
         if returncode != 0:
-            Logger.error(f"Failed to start webapp: {stderr}")
+            Logger.error(f"Failed to create webapp: {stderr}")
             return False
 
-        Logger.success("Webapp container started")
+        Logger.success("Webapp container created")
         return True
 
-    def start_nginx(self) -> bool:
-        """Start nginx container"""
-        Logger.header("Starting Nginx Reverse Proxy")
+    def create_nginx(self) -> bool:
+        """Create nginx container"""
+        Logger.info("Creating nginx reverse proxy container...")
 
         returncode, _, stderr = CommandRunner.run(
             [
-                "docker", "run", "-d",
+                "docker", "create",
                 "--name", Config.NGINX_CONTAINER,
                 "--network", Config.NETWORK_NAME,
                 "-p", f"{Config.HTTP_PORT}:80",
@@ -576,100 +890,210 @@ class DockerDeployer:
         )
 
         if returncode != 0:
-            Logger.error(f"Failed to start nginx: {stderr}")
+            Logger.error(f"Failed to create nginx: {stderr}")
+            return False
+
+        Logger.success("Nginx container created")
+        return True
+
+    @staticmethod
+    def start_container(container: str, name: str) -> bool:
+        """Start a created container"""
+        returncode, _, stderr = CommandRunner.run(
+            ["docker", "start", container],
+            capture_output=True,
+            check=False
+        )
+
+        if returncode != 0:
+            Logger.error(f"Failed to start {name.lower()}: {stderr}")
             return False
 
-        Logger.success("Nginx container started")
+        Logger.success(f"{name} container started")
         return True
 
-    def wait_for_health(self) -> bool:
-        """Wait for containers to become healthy"""
+    def start_all(self) -> bool:
+        """Create both containers concurrently, then start them in order"""
+        Logger.header("Starting Containers")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            webapp_created = executor.submit(self.create_webapp)
+            nginx_created = executor.submit(self.create_nginx)
+            if not (webapp_created.result() and nginx_created.result()):
+                return False
+
+        # nginx resolves the webapp upstream at startup, so webapp has to be
+        # running on the network first
+        if not self.start_container(Config.WEBAPP_CONTAINER, "Webapp"):
+            return False
+
+        return self.start_container(Config.NGINX_CONTAINER, "Nginx")
+
+    def wait_for_health(self, since: Optional[float] = None) -> bool:
+        """
+        Wait for containers to become healthy
+
+        Args:
+            since: Unix time taken before the containers were started; events
+                from then on are replayed, so none are missed while the
+                docker events subscription is being set up
+        """
         Logger.header("Waiting for Services to be Healthy")
 
-        max_attempts = 30
+        names = {Config.WEBAPP_CONTAINER: "Webapp", Config.NGINX_CONTAINER: "Nginx"}
+        pending = list(names)
 
-        # Wait for webapp
-        Logger.info("Waiting for webapp...")
-        for attempt in range(max_attempts):
-            returncode, stdout, _ = CommandRunner.run(
-                ["docker", "inspect", "--format", "{{.State.Health.Status}}", Config.WEBAPP_CONTAINER],
-                capture_output=True,
-                check=False
+        since_args = ["--since", f"{since:.6f}"] if since is not None else []
+
+        Logger.info("Waiting for webapp and nginx...")
+        try:
+            events = subprocess.Popen(
+                [
+                    "docker", "events", *since_args,
+                    "--filter", "event=health_status",
+                    "--filter", f"container={Config.WEBAPP_CONTAINER}",
+                    "--filter", f"container={Config.NGINX_CONTAINER}",
+                    "--format", "{{.Actor.Attributes.name}} {{.Status}}"
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
             )
+        except OSError as e:
+            Logger.error(f"Failed to watch Docker events: {e}")
+            return False
 
-            if "healthy" in stdout:
-                Logger.success("Webapp is healthy")
-                break
+        # Read on a thread so the wait can time out portably (no select on
+        # pipes under Windows); None marks the end of the stream
+        lines: "queue.Queue[Optional[str]]" = queue.Queue()
 
-            time.sleep(2)
-        else:
-            Logger.error("Webapp did not become healthy in time")
-            CommandRunner.run(["docker", "logs", Config.WEBAPP_CONTAINER])
-            return False
+        def read_events():
+            for line in events.stdout:
+                lines.put(line)
+            lines.put(None)
 
-        # Wait for nginx
-        Logger.info("Waiting for nginx...")
-        for attempt in range(max_attempts):
-            returncode, stdout, _ = CommandRunner.run(
-                ["docker", "inspect", "--format", "{{.State.Health.Status}}", Config.NGINX_CONTAINER],
+        threading.Thread(target=read_events, daemon=True).start()
+
+        def mark_healthy(container: str):
+            if container in pending:
+                pending.remove(container)
+                Logger.success(f"{names[container]} is healthy")
+
+        try:
+            # Without since, containers may have become healthy before the
+            # subscription began
+            _, stdout, _ = CommandRunner.run(
+                ["docker", "inspect", "--format", "{{.Name}} {{.State.Health.Status}}", *pending],
                 capture_output=True,
                 check=False
             )
+            for line in stdout.splitlines():
+                name, _, status = line.strip().lstrip("/").partition(" ")
+                if status == "healthy":
+                    mark_healthy(name)
+
+            # The containers are waited on together, so they share the
+            # combined per-container budget
+            deadline = time.monotonic() + Config.HEALTH_TIMEOUT * len(names)
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    line = lines.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if line is None:
+                    break
+                name, _, status = line.strip().partition(" ")
+                if status == "health_status: healthy":
+                    mark_healthy(name)
+        finally:
+            events.terminate()
+            events.wait()
+
+        for container in pending:
+            Logger.error(f"{names[container]} did not become healthy in time")
+            CommandRunner.run(["docker", "logs", container])
+
+        return not pending
 
-            if "healthy" in stdout:
-                Logger.success("Nginx is healthy")
-                break
-
-            time.sleep(2)
-        else:
-            Logger.error("Nginx did not become healthy in time")
-            CommandRunner.run(["docker", "logs", Config.NGINX_CONTAINER])
-            return False
-
-        return True
+    @staticmethod
+    def _request(conn: http.client.HTTPConnection, path: str,
+                 method: str = "GET") -> Optional[http.client.HTTPResponse]:
+        """Send a request on a persistent connection, returning None on failure"""
+        try:
+            conn.request(method, path)
+            response = conn.getresponse()
+            response.read()  # Drain the body so the connection can be reused
+            return response
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            return None
 
     def run_tests(self) -> bool:
         """Run health checks"""
         Logger.header("Running Health Checks")
 
-        # Test HTTPS endpoint
+        try:
+            ssl_context = ssl.create_default_context(
+                cafile=str(Path(Config.CERTS_DIR) / "ca.crt")
+            )
+        except OSError as e:
+            Logger.error(f"Failed to load CA certificate: {e}")
+            return False
+
+        def check_endpoint(endpoint: str, session: Optional[ssl.SSLSession] = None
+                           ) -> Tuple[Optional[http.client.HTTPResponse], Optional[ssl.SSLSession]]:
+            # http.client connections are not thread-safe, so each check
+            # gets its own, resuming the given TLS session when possible
+            conn = _ResumableHTTPSConnection(
+                "localhost", Config.HTTPS_PORT, ssl_context, session=session, timeout=3
+            )
+            try:
+                response = self._request(conn, endpoint)
+                # Read after the response, as TLS 1.3 tickets arrive post-handshake
+                return response, conn.sock.session if conn.sock else None
+            finally:
+                conn.close()
+
+        # Test HTTPS endpoint (its TLS session is reused for later checks)
         Logger.info("Testing HTTPS endpoint...")
-        if CommandRunner.run_silent([
-            "curl", "--cacert", "certs/ca.crt", "-sf",
-            f"https://localhost:{Config.HTTPS_PORT}/health"
-        ]):
+        response, session = check_endpoint("/health")
+        if response is not None and response.status < 400:
             Logger.success("HTTPS endpoint is working")
         else:
             Logger.error("HTTPS endpoint test failed")
             return False
 
-        # Test HTTP redirect
+        # Test HTTP redirect (not followed, only the Location is checked)
         Logger.info("Testing HTTP redirect...")
-        returncode, stdout, _ = CommandRunner.run(
-            ["curl", "-I", f"http://localhost:{Config.HTTP_PORT}/health"],
-            capture_output=True,
-            check=False
-        )
-        if "location: https" in stdout.lower():
+        http_conn = http.client.HTTPConnection("localhost", Config.HTTP_PORT, timeout=3)
+        try:
+            response = self._request(http_conn, "/health", method="HEAD")
+        finally:
+            http_conn.close()
+        if response is not None and response.getheader("Location", "").startswith("https://"):
             Logger.success("HTTP redirects to HTTPS")
         else:
             Logger.error("HTTP redirect test failed")
             return False
 
-        # Test all endpoints
+        # Test all endpoints concurrently, reporting each one
         Logger.info("Testing all endpoints...")
         endpoints = ["/", "/health", "/about"]
-        for endpoint in endpoints:
-            if CommandRunner.run_silent([
-                "curl", "--cacert", "certs/ca.crt", "-sf",
-                f"https://localhost:{Config.HTTPS_PORT}{endpoint}"
-            ]):
-                Logger.success(f"GET {endpoint} working")
-            else:
-                Logger.error(f"GET {endpoint} failed")
-                return False
-
-        return True
+        success = True
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            futures = {endpoint: executor.submit(check_endpoint, endpoint, session) for endpoint in endpoints}
+            for endpoint, future in futures.items():
+                response, _ = future.result()
+                if response is not None and response.status < 400:
+                    Logger.success(f"GET {endpoint} working")
+                else:
+                    Logger.error(f"GET {endpoint} failed")
+                    success = False
+
+        return success
 
     def show_status(self):
         """Show deployment status"""
@@ -701,9 +1125,10 @@ class DockerDeployer:
         """Stop running containers"""
         Logger.header("Stopping Services")
 
-        for container in [Config.NGINX_CONTAINER, Config.WEBAPP_CONTAINER]:
-            CommandRunner.run_silent(["docker", "stop", container])
-            CommandRunner.run_silent(["docker", "rm", container])
+        existing = self.existing_containers()
+        containers = [c for c in [Config.NGINX_CONTAINER, Config.WEBAPP_CONTAINER] if c in existing]
+        if containers:
+            self.remove_containers(containers)
 
         Logger.success("Services stopped")
         return True
@@ -720,8 +1145,7 @@ class DockerDeployer:
         Logger.success("Network removed")
 
         # Remove images
-        CommandRunner.run_silent(["docker", "rmi", Config.WEBAPP_IMAGE])
-        CommandRunner.run_silent(["docker", "rmi", Config.NGINX_IMAGE])
+        CommandRunner.run_silent(["docker", "rmi", Config.WEBAPP_IMAGE, Config.NGINX_IMAGE])
         Logger.success("Images removed")
 
         Logger.success("Cleanup complete")
@@ -747,9 +1171,9 @@ class DeploymentPipeline:
         self.cert_gen = CertificateGenerator()
         self.deployer = DockerDeployer()
 
-    def generate_certs(self) -> bool:
+    def generate_certs(self, force: bool = False) -> bool:
         """Generate SSL/TLS certificates"""
-        return self.cert_gen.generate_all()
+        return self.cert_gen.generate_all(force=force)
 
     def build(self) -> bool:
         """Build Docker images"""
@@ -768,13 +1192,11 @@ class DeploymentPipeline:
         if not self.deployer.stop_existing_containers():
             return False
 
-        if not self.deployer.start_webapp():
-            return False
-
-        if not self.deployer.start_nginx():
+        started_at = time.time()
+        if not self.deployer.start_all():
             return False
 
-        if not self.deployer.wait_for_health():
+        if not self.deployer.wait_for_health(since=started_at):
             return False
 
         return True
@@ -784,15 +1206,11 @@ class DeploymentPipeline:
         Logger.header("Starting Deployment Pipeline")
         print()
 
-        # Step 1: Generate certificates
-        certs_exist = (Path(Config.CERTS_DIR) / "server.crt").exists()
-        if not certs_exist:
-            Logger.info("Generating SSL/TLS certificates...")
-            if not self.generate_certs():
-                Logger.error("Certificate generation failed")
-                return False
-        else:
-            Logger.success("Certificates already exist")
+        # Step 1: Generate certificates (valid existing ones are reused)
+        Logger.info("Checking SSL/TLS certificates...")
+        if not self.generate_certs():
+            Logger.error("Certificate generation failed")
+            return False
 
         # Step 2: Check Docker
         if not self.deployer.check_docker():
@@ -847,6 +1265,7 @@ def main():
 Examples:
   python3 deploy.py deploy       # Full deployment (certs + build + start + test)
   python3 deploy.py certs        # Generate certificates only
+  python3 deploy.py certs --force # Regenerate certificates even if valid
   python3 deploy.py build        # Build Docker images only
   python3 deploy.py start        # Start containers only
   python3 deploy.py stop         # Stop containers
@@ -868,6 +1287,12 @@ Examples:
         help=f"Domain for certificates (default: {Config.DOMAIN})"
     )
 
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate certificates even if valid ones exist"
+    )
+
     args = parser.parse_args()
 
     # Update domain if specified
@@ -882,7 +1307,7 @@ Examples:
         if args.action == "deploy":
             success = pipeline.deploy()
         elif args.action == "certs":
-            success = pipeline.generate_certs()
+            success = pipeline.generate_certs(force=args.force)
         elif args.action == "build":
             success = pipeline.build()
         elif args.action == "start":